@@ -0,0 +1,80 @@
+import os
+import sys
+from flask import Flask
+from flask.json.provider import DefaultJSONProvider
+from dotenv import load_dotenv
+import orjson
+
+from app.extensions import db, cache, swagger, line_bot
+
+
+# jsonify 改用 orjson（C 實作）序列化，datetime 直接輸出 RFC 3339 格式
+class ORJSONProvider(DefaultJSONProvider):
+    def dumps(self, obj, **kwargs):
+        option = orjson.OPT_NAIVE_UTC | orjson.OPT_UTC_Z | orjson.OPT_NON_STR_KEYS
+        if self.sort_keys:
+            option |= orjson.OPT_SORT_KEYS
+        return orjson.dumps(obj, default=self.default, option=option).decode()
+
+    def loads(self, s, **kwargs):
+        return orjson.loads(s)
+
+
+# 選擇 MySQL 驅動：gevent worker 底下只能用可以被 monkey patch 的 pymysql；
+# 其他情況（例如 RQ worker）用 mysqlclient（C 實作），每次查詢的 CPU 成本低很多
+def _mysql_driver():
+    monkey = sys.modules.get('gevent.monkey')
+    if monkey is not None and monkey.is_module_patched('socket'):
+        return 'pymysql'
+    return 'mysqldb'
+
+
+# 建立 Flask 應用
+def create_app():
+    load_dotenv()  # 會自動從根目錄的 .env 檔載入變數
+
+    app = Flask(__name__)
+    app.json = ORJSONProvider(app)
+    app.config['MAX_CONTENT_LENGTH'] = 1024 * 1024  # 限制 request body 大小（1MB），超過直接回 413
+
+    # 設定資料庫配置（MySQL）
+    # Flasgger文件網址: https://testpythonflask1-production.up.railway.app/apidocs
+    database_uri = os.getenv('MYSQL_PUBLIC_URL')  # 設定 MySQL 資料庫 URI（從 Railway 取得）
+    # Railway 給的 mysql:// 沒有指定驅動，依執行環境補上（已指定驅動的 URI 不動）
+    if database_uri and database_uri.startswith('mysql://'):
+        database_uri = database_uri.replace('mysql://', f'mysql+{_mysql_driver()}://', 1)
+    app.config['SQLALCHEMY_DATABASE_URI'] = database_uri
+    app.config['SQLALCHEMY_TRACK_MODIFICATIONS'] = False
+    # 連線池設定：Railway 約 300 秒會關閉閒置連線，所以 280 秒就回收；pre_ping 避免拿到已斷線的連線
+    app.config['SQLALCHEMY_ENGINE_OPTIONS'] = {
+        'pool_size': 10,
+        'max_overflow': 20,
+        'pool_pre_ping': True,
+        'pool_recycle': 280,
+        'pool_timeout': 5,
+    }
+
+    # 設定快取（有 REDIS_URL 才用 Redis）；沒有時不快取（NullCache），
+    # 因為行程內的記憶體快取在多個 gunicorn worker 之間無法同步清除，會讀到舊資料
+    app.config['REDIS_URL'] = os.getenv('REDIS_URL')
+    app.config['CACHE_TYPE'] = 'RedisCache' if app.config['REDIS_URL'] else 'NullCache'
+    app.config['CACHE_REDIS_URL'] = app.config['REDIS_URL']
+    app.config['CACHE_NO_NULL_WARNING'] = True
+
+    # 設定 LINE API 的 Token 和 Secret
+    # line
+    # https://testpythonflask1-production.up.railway.app/callback
+    app.config['LINE_CHANNEL_ACCESS_TOKEN'] = os.getenv('LINE_CHANNEL_ACCESS_TOKEN')
+    app.config['LINE_CHANNEL_SECRET'] = os.getenv('LINE_CHANNEL_SECRET')
+
+    db.init_app(app)
+    cache.init_app(app)
+    swagger.init_app(app)
+    line_bot.init_app(app)
+
+    from app.routes import api_bp
+    from app.webhook import webhook_bp
+    app.register_blueprint(api_bp)
+    app.register_blueprint(webhook_bp)
+
+    return app
@@ -0,0 +1,12 @@
+from flask_sqlalchemy import SQLAlchemy
+from flask_caching import Cache
+from flasgger import Swagger
+
+from app.line import LineBot
+
+
+# 擴充套件在這裡建立，由 create_app() 呼叫 init_app 綁定到 Flask 應用
+db = SQLAlchemy()
+cache = Cache()
+swagger = Swagger()
+line_bot = LineBot()
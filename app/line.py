@@ -0,0 +1,77 @@
+import requests
+from flask import current_app
+from redis import Redis
+from rq import Queue
+from linebot import LineBotApi, SignatureValidator, WebhookParser
+from linebot.http_client import HttpClient, RequestsHttpClient, RequestsHttpResponse
+
+
+# LINE SDK 預設每次呼叫都用 requests.get/post 建新連線（每次都要重新 TLS 握手），
+# 改用共用的 requests.Session，讓 get_profile / reply_message 可以重用 keep-alive 連線
+class SessionHttpClient(RequestsHttpClient):
+    def __init__(self, timeout=HttpClient.DEFAULT_TIMEOUT):
+        super().__init__(timeout)
+        self.session = requests.Session()
+
+    def get(self, url, headers=None, params=None, stream=False, timeout=None):
+        response = self.session.get(
+            url, headers=headers, params=params, stream=stream, timeout=timeout or self.timeout
+        )
+        return RequestsHttpResponse(response)
+
+    def post(self, url, headers=None, data=None, timeout=None):
+        response = self.session.post(url, headers=headers, data=data, timeout=timeout or self.timeout)
+        return RequestsHttpResponse(response)
+
+    def put(self, url, headers=None, data=None, timeout=None):
+        response = self.session.put(url, headers=headers, data=data, timeout=timeout or self.timeout)
+        return RequestsHttpResponse(response)
+
+    def delete(self, url, headers=None, data=None, timeout=None):
+        response = self.session.delete(url, headers=headers, data=data, timeout=timeout or self.timeout)
+        return RequestsHttpResponse(response)
+
+
+# LINE Bot 擴充套件：init_app 依 app.config 建立 LINE API client、簽章驗證、webhook 解析器和 RQ 佇列，
+# 存在 app.extensions['line_bot']；事件處理函式用 @line_bot.add(...) 註冊，和 WebhookHandler.add 用法一樣
+class LineBot:
+    def __init__(self):
+        self._handlers = {}
+
+    def init_app(self, app):
+        secret = app.config['LINE_CHANNEL_SECRET']
+        redis_url = app.config['REDIS_URL']
+        app.extensions['line_bot'] = {
+            'api': LineBotApi(app.config['LINE_CHANNEL_ACCESS_TOKEN'], http_client=SessionHttpClient),
+            'signature_validator': SignatureValidator(secret),
+            'parser': WebhookParser(secret),
+            # 有 REDIS_URL 時把 LINE 事件丟到 RQ 佇列，由 worker 行程處理（Procfile 的 worker）；
+            # 本機開發沒有 Redis 就直接在 request 裡處理
+            'queue': Queue('line_events', connection=Redis.from_url(redis_url)) if redis_url else None,
+        }
+
+    def add(self, event, message=None):
+        def decorator(func):
+            self._handlers[(event, message)] = func
+            return func
+        return decorator
+
+    @property
+    def api(self):
+        return current_app.extensions['line_bot']['api']
+
+    @property
+    def queue(self):
+        return current_app.extensions['line_bot']['queue']
+
+    def validate_signature(self, body, signature):
+        return current_app.extensions['line_bot']['signature_validator'].validate(body, signature)
+
+    # 解析 webhook 內容並交給對應的處理函式；簽章不符時丟出 InvalidSignatureError
+    def handle(self, body, signature):
+        events = current_app.extensions['line_bot']['parser'].parse(body, signature)
+        for event in events:
+            message = getattr(event, 'message', None)
+            func = self._handlers.get((type(event), type(message))) or self._handlers.get((type(event), None))
+            if func is not None:
+                func(event)
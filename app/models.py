@@ -0,0 +1,55 @@
+from datetime import datetime
+
+from app.extensions import db, cache
+
+
+# 定義資料庫模型
+# 用戶資料表格
+class User(db.Model):
+    user_id = db.Column(db.Integer, primary_key=True)
+    line_user_id = db.Column(db.String(255), unique=True, nullable=False)
+    name = db.Column(db.String(255), nullable=False)
+    created_at = db.Column(db.DateTime, default=datetime.utcnow)
+
+
+# 打卡紀錄資料表格
+class Checkin(db.Model):
+    # (user_id, checkin_time) 複合索引：依用戶查詢並依時間排序時不需要 filesort
+    __table_args__ = (db.Index('ix_checkin_user_time', 'user_id', 'checkin_time'),)
+
+    checkin_id = db.Column(db.Integer, primary_key=True)
+    user_id = db.Column(db.Integer, db.ForeignKey('user.user_id'), nullable=False)
+    checkin_time = db.Column(db.DateTime, default=datetime.utcnow)
+
+
+# LINE 回覆資料表格
+class LineReply(db.Model):
+    reply_id = db.Column(db.Integer, primary_key=True)
+    user_id = db.Column(db.Integer, db.ForeignKey('user.user_id'), nullable=False)
+    reply_message = db.Column(db.Text, nullable=False)
+    reply_time = db.Column(db.DateTime, default=datetime.utcnow)
+
+
+# API 回應的快取 key，快取和清除都要用同一組 key
+USERS_CACHE_KEY = 'users:all'
+
+
+def checkins_cache_key(user_id):
+    return f'checkins:{user_id}'
+
+
+# line_user_id -> user_id 註冊後就不會變，快取起來讓每個 webhook 少一次 SELECT
+# （查不到時回傳 None，Flask-Caching 不會把 None 當成命中，所以新用戶註冊後就能查到）
+@cache.memoize(timeout=3600)
+def get_user_id_by_line(line_user_id):
+    return db.session.query(User.user_id).filter_by(line_user_id=line_user_id).scalar()
+
+
+# 批次寫入打卡紀錄（匯入 / 補登用），pairs 為 (user_id, checkin_time) 的序列
+# 注意：bulk_insert_mappings 繞過 ORM，不會觸發 model 事件，也不會回填主鍵
+def bulk_record_checkins(pairs):
+    mappings = [{'user_id': user_id, 'checkin_time': checkin_time} for user_id, checkin_time in pairs]
+    db.session.bulk_insert_mappings(Checkin, mappings)
+    db.session.commit()
+    for user_id in {m['user_id'] for m in mappings}:
+        cache.delete(checkins_cache_key(user_id))
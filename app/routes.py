@@ -0,0 +1,216 @@
+from flask import Blueprint, request, jsonify
+
+from app.extensions import db, cache
+from app.models import (
+    User, Checkin, LineReply, USERS_CACHE_KEY, checkins_cache_key, get_user_id_by_line,
+)
+
+
+# 所有 /api/* 的 API
+api_bp = Blueprint('api', __name__, url_prefix='/api')
+
+
+# 設計 POST /api/checkin API
+@api_bp.route('/checkin', methods=['POST'])
+def checkin():
+    """
+    User check-in API
+    ---
+    parameters:
+      - name: line_user_id
+        in: json
+        type: string
+        required: true
+        description: LINE user ID
+    responses:
+      200:
+        description: "Check-in successful"
+        schema:
+          type: object
+          properties:
+            message:
+              type: string
+              example: "You have successfully checked in!"
+    """
+    data = request.get_json()
+    line_user_id = data.get('line_user_id')
+
+    # 查找用戶
+    user_id = get_user_id_by_line(line_user_id)
+
+    if user_id is None:
+        return jsonify({"message": "User not found"}), 404
+
+    # 儲存打卡紀錄
+    checkin = Checkin(user_id=user_id)
+    db.session.add(checkin)
+    db.session.commit()
+    cache.delete(checkins_cache_key(user_id))
+
+    return jsonify({"message": "You have successfully checked in!"})
+
+
+# 設計 GET /api/checkins/{user_id} API
+@api_bp.route('/checkins/<int:user_id>', methods=['GET'])
+@cache.cached(timeout=30, key_prefix=lambda: checkins_cache_key(request.view_args['user_id']))
+def get_checkins(user_id):
+    """
+    Get check-ins of a user
+    ---
+    parameters:
+      - name: user_id
+        in: path
+        type: integer
+        required: true
+        description: User ID
+    responses:
+      200:
+        description: "User check-ins found"
+        schema:
+          type: object
+          properties:
+            checkins:
+              type: array
+              items:
+                type: object
+                properties:
+                  checkin_id:
+                    type: integer
+                  checkin_time:
+                    type: string
+                    format: date-time
+    """
+    # 只取需要的欄位，不建立完整的 ORM 物件
+    checkins = Checkin.query.filter_by(user_id=user_id).with_entities(Checkin.checkin_id, Checkin.checkin_time).all()
+    checkin_list = [
+        {"checkin_id": checkin_id, "checkin_time": checkin_time}
+        for checkin_id, checkin_time in checkins
+    ]
+
+    return jsonify({"checkins": checkin_list})
+
+
+# 設計 POST /api/line_reply API
+@api_bp.route('/line_reply', methods=['POST'])
+def line_reply():
+    """
+    Reply to a user in LINE
+    ---
+    parameters:
+      - name: user_id
+        in: json
+        type: integer
+        required: true
+        description: User ID
+      - name: reply_message
+        in: json
+        type: string
+        required: true
+        description: Message to reply to the user
+    responses:
+      200:
+        description: "Reply sent successfully"
+        schema:
+          type: object
+          properties:
+            message:
+              type: string
+              example: "Reply sent successfully!"
+    """
+    data = request.get_json()
+    user_id = data.get('user_id')
+    reply_message = data.get('reply_message')
+
+    # 確認用戶存在（只查主鍵欄位，不建立 ORM 物件）
+    exists = db.session.query(User.user_id).filter_by(user_id=user_id).scalar()
+
+    if exists is None:
+        return jsonify({"message": "User not found"}), 404
+
+    # 儲存LINE回覆
+    reply = LineReply(user_id=user_id, reply_message=reply_message)
+    db.session.add(reply)
+    db.session.commit()
+
+    return jsonify({"message": "Reply sent successfully!"})
+
+# 註冊使用者 API
+@api_bp.route('/register', methods=['POST'])
+def register_user():
+    """
+    Register a new LINE user
+    ---
+    parameters:
+      - name: line_user_id
+        in: json
+        type: string
+        required: true
+        description: LINE user ID
+      - name: name
+        in: json
+        type: string
+        required: true
+        description: Name of the user
+    responses:
+      200:
+        description: User registration result
+        schema:
+          type: object
+          properties:
+            message:
+              type: string
+    """
+    data = request.get_json()
+    line_user_id = data.get('line_user_id')
+    name = data.get('name')
+
+    if not line_user_id or not name:
+        return jsonify({"message": "Missing line_user_id or name"}), 400
+
+    # 檢查用戶是否已存在
+    if get_user_id_by_line(line_user_id) is not None:
+        return jsonify({"message": "User already registered"}), 200
+
+    # 新增用戶
+    new_user = User(line_user_id=line_user_id, name=name)
+    db.session.add(new_user)
+    db.session.commit()
+    cache.delete_memoized(get_user_id_by_line, line_user_id)
+    cache.delete(USERS_CACHE_KEY)
+
+    return jsonify({"message": "User registered successfully"}), 201
+
+# 查詢所有用戶的 API
+@api_bp.route('/users', methods=['GET'])
+@cache.cached(timeout=60, key_prefix=USERS_CACHE_KEY)
+def get_users():
+    """
+    Get a list of all registered users
+    ---
+    responses:
+      200:
+        description: A list of all users in the system
+        schema:
+          type: object
+          properties:
+            users:
+              type: array
+              items:
+                type: object
+                properties:
+                  user_id:
+                    type: integer
+                    description: User's unique ID
+                  line_user_id:
+                    type: string
+                    description: User's LINE user ID
+                  name:
+                    type: string
+                    description: User's name
+    """
+    users = User.query.all()
+    user_list = [
+        {"user_id": user.user_id, "line_user_id": user.line_user_id, "name": user.name}
+        for user in users
+    ]
+    return jsonify({"users": user_list})
@@ -0,0 +1,123 @@
+from flask import Blueprint, request, abort
+from sqlalchemy import func
+from sqlalchemy.dialects.mysql import insert as mysql_insert
+from linebot.exceptions import InvalidSignatureError
+from linebot.models import MessageEvent, TextMessage, TextSendMessage
+
+from app.extensions import db, cache, line_bot
+from app.models import User, Checkin, USERS_CACHE_KEY, checkins_cache_key, get_user_id_by_line
+
+
+webhook_bp = Blueprint('webhook', __name__)
+
+# worker 行程裡共用的 Flask 應用，第一次執行工作時才建立
+_worker_app = None
+
+
+# RQ worker 執行的背景工作：處理 LINE 事件（查 DB、呼叫 LINE API、回覆訊息）
+# callback 放進佇列前已驗證過簽章，這裡 parse 時會再驗一次（只是 HMAC），
+# 刻意保留當作防護：Redis 裡的工作內容不直接信任
+def process_line_event(body, signature):
+    global _worker_app
+    if _worker_app is None:
+        from app import create_app
+        _worker_app = create_app()
+    with _worker_app.app_context():
+        line_bot.handle(body, signature)
+
+
+# 設置 LINE Webhook 路由
+@webhook_bp.route("/callback", methods=["POST"])
+def callback():
+    # 確保是 LINE 發來的請求，沒有簽章就直接拒絕，不用讀取 body
+    signature = request.headers.get("X-Line-Signature")
+    if not signature:
+        abort(400)
+
+    body = request.get_data(as_text=True)
+    if line_bot.queue is None:
+        try:
+            line_bot.handle(body, signature)
+        except InvalidSignatureError:
+            abort(400)
+        return 'OK', 200
+
+    # 先驗證簽章（只是 HMAC 計算）再放進佇列，馬上回 200 給 LINE，避免 LINE 等太久重送
+    if not line_bot.validate_signature(body, signature):
+        abort(400)
+    line_bot.queue.enqueue(process_line_event, body, signature)
+
+    return 'OK', 200
+
+
+# LINE 文字指令，每個指令接收 user_id 並回傳回覆文字
+# 指令只把要寫入的資料放進 session，commit 統一由 handle_message 處理
+def _cmd_query(user_id):
+    # 只取最新的 20 筆（LINE 訊息也有長度上限），時間直接在 MySQL 用 DATE_FORMAT 格式化
+    rows = (
+        db.session.query(func.date_format(Checkin.checkin_time, '%Y-%m-%d %H:%i:%s'))
+        .filter_by(user_id=user_id)
+        .order_by(Checkin.checkin_time.desc())
+        .limit(20)
+        .all()
+    )
+    if not rows:
+        return "❌ 你還沒有任何打卡紀錄喔。"
+    reply = "\n".join([t for (t,) in rows])
+    return f"📅 你的打卡紀錄：\n{reply}"
+
+
+def _cmd_checkin(user_id):
+    new_checkin = Checkin(user_id=user_id)
+    db.session.add(new_checkin)
+    return "✅ 你已成功打卡！"
+
+
+COMMANDS = {
+    "查詢": _cmd_query,
+    "打卡": _cmd_checkin,
+}
+# 指令 commit 後要清除的快取 key（依 user_id 產生），沒有寫入的指令不用列
+COMMAND_CACHE_KEYS = {
+    "打卡": [checkins_cache_key],
+}
+# 預設回覆是固定文字，訊息物件在載入時建立一次就好
+DEFAULT_MSG = TextSendMessage(text="請輸入『打卡』或『查詢』來使用服務！")
+
+
+# 處理 LINE 訊息
+@line_bot.add(MessageEvent, message=TextMessage)
+def handle_message(event):
+    line_user_id = event.source.user_id
+    user_id = get_user_id_by_line(line_user_id)
+
+    # 如果用戶不存在就註冊
+    created_user = user_id is None
+    if created_user:
+        try:
+            profile = line_bot.api.get_profile(line_user_id)
+            display_name = profile.display_name
+        except:
+            display_name = "LINE User"
+        # INSERT ... ON DUPLICATE KEY UPDATE：同一用戶的 webhook 同時進來也不會撞到 unique，
+        # 用 LAST_INSERT_ID(user_id) 讓已存在時 lastrowid 也會回傳原本的 user_id
+        stmt = mysql_insert(User).values(line_user_id=line_user_id, name=display_name)
+        stmt = stmt.on_duplicate_key_update(user_id=func.last_insert_id(User.__table__.c.user_id))
+        user_id = db.session.execute(stmt).lastrowid
+
+    text = event.message.text.strip().lower()
+
+    # 處理不同指令
+    handler_fn = COMMANDS.get(text)
+    reply_msg = TextSendMessage(text=handler_fn(user_id)) if handler_fn else DEFAULT_MSG
+
+    # 新用戶的註冊資料和指令寫入的資料在同一個 transaction 裡，只 commit 一次，之後才清快取
+    db.session.commit()
+    if created_user:
+        cache.delete_memoized(get_user_id_by_line, line_user_id)
+        cache.delete(USERS_CACHE_KEY)
+    for make_key in COMMAND_CACHE_KEYS.get(text, []):
+        cache.delete(make_key(user_id))
+
+    # 回覆訊息
+    line_bot.api.reply_message(event.reply_token, reply_msg)
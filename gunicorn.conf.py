@@ -0,0 +1,9 @@
+import os
+
+# 用 gevent worker 啟動：worker 載入 app 前會先 monkey patch，
+# 呼叫 LINE API 和 pymysql 讀寫時會讓出給其他請求，不會整個 worker 卡住
+# 啟動方式: gunicorn wsgi:app（gunicorn 會自動讀取這個設定檔）
+bind = f"0.0.0.0:{os.getenv('PORT', '8000')}"
+worker_class = 'gevent'
+workers = int(os.getenv('WEB_CONCURRENCY', '2'))
+worker_connections = 500
@@ -0,0 +1,12 @@
+from app import create_app
+from app.extensions import db
+
+
+# gunicorn 的進入點: gunicorn wsgi:app
+app = create_app()
+
+# 啟動 Flask 應用
+if __name__ == "__main__":
+    with app.app_context():
+        db.create_all()  # 建立資料表
+    app.run(host='0.0.0.0')